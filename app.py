@@ -10,7 +10,7 @@ from prompt_service import get_prompt_service, PromptServiceError
 from error_handler import get_error_handler, ErrorCategory, ErrorSeverity, create_error_response
 from performance_optimizer import (
     performance_metrics, conversation_manager, file_optimizer, response_monitor,
-    cleanup_system_resources, get_performance_status
+    cleanup_system_resources, get_performance_status, start_background_cleanup
 )
 from security import (
     security_required, InputValidator, get_file_system_security, 
@@ -37,6 +37,9 @@ app = Flask(__name__)
 # Apply configuration to Flask app
 app.config.update(config.get_config_dict())
 
+# Start periodic resource cleanup (no-op if it is already running)
+start_background_cleanup()
+
 # Print configuration summary in development mode
 if getattr(config, 'DEBUG', False):
     print_config_summary(config)
@@ -225,8 +228,8 @@ def _process_chat_interaction(conversation_history: list, stream: bool = False)
             logger.info(f"Cleaned up conversation history: {original_length} -> {len(conversation_history)} messages")
     
     # Record conversation statistics
-    performance_metrics.conversation_stats['total_requests'] += 1
-    performance_metrics.conversation_stats['total_messages'] += len(conversation_history)
+    performance_metrics.increment_conversation_stat('total_requests')
+    performance_metrics.increment_conversation_stat('total_messages', len(conversation_history))
     
     # Log the incoming request
     logger.info(f"Processing chat request with {len(conversation_history)} messages (streaming: {stream})")
@@ -1449,8 +1452,8 @@ def trigger_performance_cleanup():
     Returns JSON response with cleanup results
     """
     try:
-        # Perform system cleanup
-        cleanup_system_resources()
+        # Perform system cleanup; an explicit request gets a full collection
+        cleanup_system_resources(full_collection=True)
         
         # Get updated performance status
         status = get_performance_status()
@@ -44,6 +44,10 @@ class Config:
     def PROMPT_CONFIG_FILE(self):
         return os.environ.get('PROMPT_CONFIG_FILE', 'prompt_config.json')
     
+    @property
+    def PRETTY_JSON(self):
+        return os.environ.get('PRETTY_JSON', 'False').lower() == 'true'
+    
     @property
     def MAX_MEMORY_FILE_SIZE(self):
         return int(os.environ.get('MAX_MEMORY_FILE_SIZE', '10485760'))  # 10MB
@@ -239,8 +239,13 @@ Remember: Respond with ONLY the JSON object, no other text."""
                 if not isinstance(new_insights, list):
                     raise MemoryServiceError("Insights must be a list")
                 
-                # Load existing memory data if file exists
-                existing_data = self._load_memory_file()
+                # Load existing memory data if file exists. Only the top level and the
+                # two lists appended to below are copied, so the file cache never holds
+                # changes that failed to reach the disk
+                loaded_data = self._load_memory_file()
+                existing_data = dict(loaded_data)
+                existing_data['insights'] = list(loaded_data.get('insights', []))
+                existing_data['conversation_summaries'] = list(loaded_data.get('conversation_summaries', []))
                 
                 # Add new insights to existing data
                 if 'insights' not in existing_data:
@@ -305,7 +310,9 @@ Remember: Respond with ONLY the JSON object, no other text."""
         Load existing memory data from file with enhanced error handling and caching
         
         Returns:
-            dict: Existing memory data or empty structure if file doesn't exist
+            dict: Existing memory data or empty structure if file doesn't exist.
+            The data may be shared with the file cache and must not be
+            modified; copy it first.
         """
         default_structure = {
             'insights': [],
@@ -332,6 +339,10 @@ Remember: Respond with ONLY the JSON object, no other text."""
                 from performance_optimizer import file_optimizer
                 data = file_optimizer.cached_file_read(self.memory_file, max_age_seconds=60)
                 if data is not None:
+                    # The cached dict is shared; add missing fields to a copy of it
+                    if not {'insights', 'conversation_summaries', 'metadata'}.issubset(data):
+                        data = dict(data)
+                    
                     # Ensure required fields exist
                     if 'insights' not in data:
                         data['insights'] = []
@@ -6,25 +6,37 @@ and automatic optimization for the serendipity analysis system.
 """
 
 import time
+import math
+import itertools
 import psutil
 import threading
-import queue
 import logging
 import json
-import hashlib
-from datetime import datetime, timedelta
-from typing import Dict, Any, List, Optional, Callable, Union
-from dataclasses import dataclass, field, asdict
-from collections import defaultdict, deque
-from pathlib import Path
-import asyncio
-from concurrent.futures import ThreadPoolExecutor, Future
+from datetime import datetime
+from typing import Dict, Any, List, Optional, Callable
+from dataclasses import dataclass, field, fields, replace
+from collections import deque
 import gc
+import os
 import sys
 
 logger = logging.getLogger(__name__)
 
-@dataclass
+# Slotted dataclasses need Python 3.10+; older interpreters keep the regular __dict__ layout
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# Field names per dataclass, resolved once instead of on every to_dict call
+_FIELD_NAMES: Dict[type, tuple] = {}
+
+def _dataclass_to_dict(obj) -> Dict[str, Any]:
+    """Shallow dictionary view of a flat metrics dataclass (no deepcopy like asdict)"""
+    cls = type(obj)
+    names = _FIELD_NAMES.get(cls)
+    if names is None:
+        names = _FIELD_NAMES[cls] = tuple(f.name for f in fields(cls))
+    return {name: getattr(obj, name) for name in names}
+
+@dataclass(**_DATACLASS_SLOTS)
 class PerformanceMetrics:
     """Performance metrics for analysis operations"""
     operation_id: str
@@ -55,9 +67,9 @@ class PerformanceMetrics:
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for serialization"""
-        return asdict(self)
+        return _dataclass_to_dict(self)
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class SystemResourceSnapshot:
     """Snapshot of system resources at a point in time"""
     timestamp: float
@@ -73,9 +85,26 @@ class SystemResourceSnapshot:
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for serialization"""
-        return asdict(self)
+        return _dataclass_to_dict(self)
+
+def _snapshot_timestamp(snapshot: SystemResourceSnapshot) -> float:
+    return snapshot.timestamp
+
+# Template returned (with a fresh timestamp) when resources cannot be read
+_EMPTY_SNAPSHOT = SystemResourceSnapshot(
+    timestamp=0.0,
+    cpu_percent=0.0,
+    memory_percent=0.0,
+    memory_available_mb=0.0,
+    disk_usage_percent=0.0,
+    disk_free_gb=0.0,
+    process_memory_mb=0.0,
+    process_cpu_percent=0.0,
+    thread_count=0,
+    open_files=0
+)
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class CacheStatistics:
     """Statistics for cache performance"""
     cache_name: str
@@ -84,6 +113,7 @@ class CacheStatistics:
     cache_misses: int = 0
     evictions: int = 0
     total_size_mb: float = 0.0
+    total_access_time_ms: float = 0.0
     average_access_time_ms: float = 0.0
     hit_rate: float = 0.0
     
@@ -92,11 +122,16 @@ class CacheStatistics:
         if self.total_requests > 0:
             self.hit_rate = self.cache_hits / self.total_requests
     
+    def update_average_access_time(self):
+        """Update the average access time from the accumulated total"""
+        if self.total_requests > 0:
+            self.average_access_time_ms = self.total_access_time_ms / self.total_requests
+    
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for serialization"""
-        return asdict(self)
+        return _dataclass_to_dict(self)
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class QueueMetrics:
     """Metrics for request queue management"""
     queue_name: str
@@ -110,7 +145,141 @@ class QueueMetrics:
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for serialization"""
-        return asdict(self)
+        return _dataclass_to_dict(self)
+
+class RingBuffer:
+    """Fixed-capacity buffer backed by a preallocated list, oldest entries overwritten first"""
+    
+    __slots__ = ("_buffer", "_capacity", "_start", "_size")
+    
+    def __init__(self, capacity: int):
+        self._buffer: List[Any] = [None] * capacity
+        self._capacity = capacity
+        self._start = 0
+        self._size = 0
+    
+    @property
+    def maxlen(self) -> int:
+        return self._capacity
+    
+    def append(self, item: Any) -> Any:
+        """Append an item, returning the entry it overwrote (None while not yet full)"""
+        if self._size < self._capacity:
+            self._buffer[(self._start + self._size) % self._capacity] = item
+            self._size += 1
+            return None
+        
+        evicted = self._buffer[self._start]
+        self._buffer[self._start] = item
+        self._start = (self._start + 1) % self._capacity
+        return evicted
+    
+    def bisect_left(self, value: Any, key: Callable[[Any], Any]) -> int:
+        """Index of the first entry whose key is >= value; entries must be appended in key order"""
+        low, high = 0, self._size
+        while low < high:
+            mid = (low + high) // 2
+            if key(self._buffer[(self._start + mid) % self._capacity]) < value:
+                low = mid + 1
+            else:
+                high = mid
+        return low
+    
+    def to_list(self, start: int = 0) -> List[Any]:
+        """Entries from logical index start to the newest, in insertion order"""
+        count = self._size - start
+        if count <= 0:
+            return []
+        first = (self._start + start) % self._capacity
+        end = first + count
+        if end <= self._capacity:
+            return self._buffer[first:end]
+        return self._buffer[first:] + self._buffer[:end - self._capacity]
+    
+    def clear(self):
+        self._buffer = [None] * self._capacity
+        self._start = 0
+        self._size = 0
+    
+    def __len__(self) -> int:
+        return self._size
+    
+    def __getitem__(self, index: int) -> Any:
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("RingBuffer index out of range")
+        return self._buffer[(self._start + index) % self._capacity]
+    
+    def __iter__(self):
+        # Walk the two contiguous halves of the list in insertion order
+        end = self._start + self._size
+        if end <= self._capacity:
+            yield from self._buffer[self._start:end]
+        else:
+            yield from self._buffer[self._start:]
+            yield from self._buffer[:end - self._capacity]
+
+@dataclass(**_DATACLASS_SLOTS)
+class OperationAggregate:
+    """Running totals for completed operations of one type"""
+    count: int = 0
+    duration_count: int = 0
+    duration_sum: float = 0.0
+    min_duration: float = math.inf
+    max_duration: float = -math.inf
+    memory_sum: float = 0.0
+    cache_hits: int = 0
+    cache_misses: int = 0
+    errors: int = 0
+    
+    def add(self, metrics: PerformanceMetrics):
+        """Fold a completed operation into the totals"""
+        self.count += 1
+        duration = metrics.duration
+        if duration:
+            self.duration_count += 1
+            self.duration_sum += duration
+            if duration < self.min_duration:
+                self.min_duration = duration
+            if duration > self.max_duration:
+                self.max_duration = duration
+        self.memory_sum += metrics.memory_usage_mb
+        self.cache_hits += metrics.cache_hits
+        self.cache_misses += metrics.cache_misses
+        if metrics.error_occurred:
+            self.errors += 1
+    
+    def merge(self, other: "OperationAggregate"):
+        """Combine the totals of another aggregate into this one"""
+        self.count += other.count
+        self.duration_count += other.duration_count
+        self.duration_sum += other.duration_sum
+        self.min_duration = min(self.min_duration, other.min_duration)
+        self.max_duration = max(self.max_duration, other.max_duration)
+        self.memory_sum += other.memory_sum
+        self.cache_hits += other.cache_hits
+        self.cache_misses += other.cache_misses
+        self.errors += other.errors
+    
+    def to_summary(self) -> Dict[str, Any]:
+        """Convert to the per-operation statistics reported in performance summaries"""
+        count = self.count
+        duration_count = self.duration_count
+        cache_total = self.cache_hits + self.cache_misses
+        
+        return {
+            "count": count,
+            "avg_duration": self.duration_sum / duration_count if duration_count else 0,
+            "max_duration": self.max_duration if duration_count else 0,
+            "min_duration": self.min_duration if duration_count else 0,
+            "avg_memory_mb": self.memory_sum / count if count else 0,
+            "total_cache_hits": self.cache_hits,
+            "total_cache_misses": self.cache_misses,
+            "cache_hit_rate": self.cache_hits / cache_total if cache_total > 0 else 0,
+            "error_count": self.errors,
+            "error_rate": self.errors / count if count else 0
+        }
 
 class PerformanceMonitor:
     """
@@ -123,20 +292,56 @@ class PerformanceMonitor:
         self.config = config or get_config()
         
         # Performance tracking
-        self.metrics_history: deque = deque(maxlen=1000)  # Keep last 1000 operations
-        self.resource_history: deque = deque(maxlen=500)   # Keep last 500 resource snapshots
+        self.metrics_history = RingBuffer(1000)  # Keep last 1000 operations
+        self._metrics_index: Dict[str, PerformanceMetrics] = {}  # operation_id -> entry in metrics_history
+        self._operation_counter = itertools.count(1)  # next() is atomic under the GIL
+        self.resource_history = RingBuffer(500)   # Keep last 500 resource snapshots
+        self._latest_snapshot: Optional[SystemResourceSnapshot] = None
         self.cache_stats: Dict[str, CacheStatistics] = {}
+        self._cache_stat_locks: Dict[str, threading.Lock] = {}
         self.queue_metrics: Dict[str, QueueMetrics] = {}
         
         # Monitoring configuration
         self.monitoring_enabled = self.config.ENABLE_PERFORMANCE_MONITORING
         self.resource_check_interval = 30  # seconds
+        self.fast_resource_check_interval = 5  # seconds, used while resources are changing quickly
+        self.fast_check_window = 60  # seconds to stay on the fast interval after a transient
+        self.cpu_change_threshold = 20.0  # percent points between snapshots that counts as a transient
         self.metrics_retention_hours = 24
         
+        # Per-operation-type totals of completed operations, bucketed by completion time so
+        # summaries merge a few buckets instead of rescanning metrics_history
+        self.aggregate_bucket_seconds = 300
+        self._operation_buckets: deque = deque(
+            maxlen=self.metrics_retention_hours * 3600 // self.aggregate_bucket_seconds
+        )  # (bucket index, {operation_type: OperationAggregate})
+        
+        # Reuse one process handle and prime the non-blocking CPU counters
+        self._process = psutil.Process()
+        psutil.cpu_percent(interval=None)
+        self._process.cpu_percent()
+        
+        # On Linux, process memory/CPU/threads come from a single /proc/self/stat read
+        self._proc_stat_fd: Optional[int] = None
+        self._proc_stat_pid: Optional[int] = None
+        self._proc_stat_lock = threading.Lock()
+        self._last_process_cpu: Optional[tuple] = None  # (monotonic time, process CPU seconds)
+        if sys.platform.startswith("linux"):
+            self._page_size_mb = os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+            self._clock_ticks = os.sysconf("SC_CLK_TCK")
+            self._read_proc_stat()
+        
+        # Disk usage changes slowly; reuse it between checks
+        self.disk_usage_cache_seconds = 30
+        self._disk_usage_cache: Optional[tuple] = None  # (timestamp, psutil disk usage)
+        
         # Resource monitoring thread
         self._monitoring_thread = None
         self._stop_monitoring = threading.Event()
-        self._lock = threading.RLock()
+        # Separate locks for independently updated structures; none of them are re-entered
+        self._metrics_lock = threading.Lock()
+        self._resource_lock = threading.Lock()
+        self._cache_lock = threading.Lock()
         
         # Performance thresholds
         self.cpu_threshold = 80.0  # percent
@@ -144,9 +349,14 @@ class PerformanceMonitor:
         self.disk_threshold = 90.0  # percent
         self.response_time_threshold = 30.0  # seconds
         
+        self._generated_at_cache: Optional[tuple] = None  # (whole second, ISO string)
+        
         # Optimization flags
         self.auto_optimization_enabled = True
         self.gc_optimization_enabled = True
+        self.gc_min_interval = 300  # seconds between triggered collections
+        self._last_gc_time = 0.0
+        self._gc_escalate = False  # next triggered collection covers all generations
         
         # Start monitoring if enabled
         if self.monitoring_enabled:
@@ -174,15 +384,43 @@ class PerformanceMonitor:
             self._stop_monitoring.set()
             self._monitoring_thread.join(timeout=5)
             logger.info("Performance monitoring stopped")
+        
+        # Release the /proc/self/stat descriptor; a later read reopens it
+        with self._proc_stat_lock:
+            self._close_proc_stat()
+    
+    def _close_proc_stat(self):
+        """Close the cached /proc/self/stat descriptor (caller holds _proc_stat_lock)"""
+        if self._proc_stat_fd is not None:
+            try:
+                os.close(self._proc_stat_fd)
+            except OSError:
+                pass
+            self._proc_stat_fd = None
     
     def _monitor_resources(self):
         """Background thread for monitoring system resources"""
-        while not self._stop_monitoring.wait(self.resource_check_interval):
+        interval = self.resource_check_interval
+        fast_until = 0.0
+        previous_cpu = None
+        
+        while not self._stop_monitoring.wait(interval):
             try:
                 snapshot = self._capture_resource_snapshot()
                 
-                with self._lock:
+                with self._resource_lock:
                     self.resource_history.append(snapshot)
+                self._latest_snapshot = snapshot
+                
+                # Poll faster while CPU usage is moving, fall back to the slow interval once it settles
+                if previous_cpu is not None and abs(snapshot.cpu_percent - previous_cpu) > self.cpu_change_threshold:
+                    fast_until = snapshot.timestamp + self.fast_check_window
+                previous_cpu = snapshot.cpu_percent
+                
+                if snapshot.timestamp < fast_until:
+                    interval = self.fast_resource_check_interval
+                else:
+                    interval = self.resource_check_interval
                 
                 # Check for resource issues and trigger optimization
                 if self.auto_optimization_enabled:
@@ -191,26 +429,83 @@ class PerformanceMonitor:
             except Exception as e:
                 logger.error(f"Error in resource monitoring: {e}")
     
+    def _read_proc_stat(self) -> Optional[tuple]:
+        """
+        Read process memory, CPU and thread count from /proc/self/stat (Linux only)
+        
+        Returns:
+            tuple: (memory MB, CPU percent, thread count), or None if unavailable
+        """
+        with self._proc_stat_lock:
+            try:
+                # Reopen after a fork, the descriptor still points at the parent's stat file
+                pid = os.getpid()
+                if self._proc_stat_fd is None or self._proc_stat_pid != pid:
+                    if self._proc_stat_pid != pid:
+                        # The parent's CPU counters don't carry over to this process
+                        self._last_process_cpu = None
+                    self._close_proc_stat()
+                    self._proc_stat_fd = os.open("/proc/self/stat", os.O_RDONLY)
+                    self._proc_stat_pid = pid
+                
+                data = os.pread(self._proc_stat_fd, 4096, 0)
+                now = time.monotonic()
+            except OSError:
+                self._close_proc_stat()
+                return None
+        
+        # Fields after the parenthesised command name start at field 3 (state)
+        values = data[data.rindex(b")") + 2:].split()
+        cpu_seconds = (int(values[11]) + int(values[12])) / self._clock_ticks  # utime + stime
+        thread_count = int(values[17])
+        memory_mb = int(values[21]) * self._page_size_mb  # rss in pages
+        
+        cpu_percent = 0.0
+        previous = self._last_process_cpu
+        if previous is not None and now > previous[0]:
+            cpu_percent = (cpu_seconds - previous[1]) / (now - previous[0]) * 100
+        self._last_process_cpu = (now, cpu_seconds)
+        
+        return memory_mb, cpu_percent, thread_count
+    
+    def _get_disk_usage(self):
+        """Return disk usage for the root filesystem, cached for disk_usage_cache_seconds"""
+        now = time.time()
+        cached = self._disk_usage_cache
+        if cached is None or now - cached[0] >= self.disk_usage_cache_seconds:
+            cached = self._disk_usage_cache = (now, psutil.disk_usage('/'))
+        return cached[1]
+    
     def _capture_resource_snapshot(self) -> SystemResourceSnapshot:
         """Capture current system resource usage"""
         try:
-            # System-wide metrics
-            cpu_percent = psutil.cpu_percent(interval=1)
+            # System-wide metrics (CPU usage since the previous call, non-blocking)
+            cpu_percent = psutil.cpu_percent(interval=None)
             memory = psutil.virtual_memory()
-            disk = psutil.disk_usage('/')
+            disk = self._get_disk_usage()
             
-            # Process-specific metrics
-            process = psutil.Process()
-            process_memory = process.memory_info().rss / (1024 * 1024)  # MB
-            process_cpu = process.cpu_percent()
+            process = self._process
+            proc_stat = self._read_proc_stat() if sys.platform.startswith("linux") else None
             
-            # Additional process metrics
-            try:
-                thread_count = process.num_threads()
-                open_files = len(process.open_files())
-            except (psutil.AccessDenied, psutil.NoSuchProcess):
-                thread_count = 0
-                open_files = 0
+            if proc_stat is not None:
+                process_memory, process_cpu, thread_count = proc_stat
+                try:
+                    open_files = len(process.open_files())
+                except (psutil.AccessDenied, psutil.NoSuchProcess):
+                    open_files = 0
+            else:
+                # Process-specific metrics, read in a single /proc pass
+                with process.oneshot():
+                    process_memory = process.memory_info().rss / (1024 * 1024)  # MB
+                    process_cpu = process.cpu_percent()
+                    
+                    # Additional process metrics
+                    try:
+                        thread_count = process.num_threads()
+                        open_files = len(process.open_files())
+                    except (psutil.AccessDenied, psutil.NoSuchProcess):
+                        thread_count = 0
+                        open_files = 0
             
             return SystemResourceSnapshot(
                 timestamp=time.time(),
@@ -227,59 +522,77 @@ class PerformanceMonitor:
         
         except Exception as e:
             logger.error(f"Error capturing resource snapshot: {e}")
-            return SystemResourceSnapshot(
-                timestamp=time.time(),
-                cpu_percent=0.0,
-                memory_percent=0.0,
-                memory_available_mb=0.0,
-                disk_usage_percent=0.0,
-                disk_free_gb=0.0,
-                process_memory_mb=0.0,
-                process_cpu_percent=0.0,
-                thread_count=0,
-                open_files=0
-            )
+            return replace(_EMPTY_SNAPSHOT, timestamp=time.time())
+    
+    def _get_latest_snapshot(self) -> SystemResourceSnapshot:
+        """Return the snapshot from the monitor thread, capturing one only if none exists yet"""
+        snapshot = self._latest_snapshot
+        if snapshot is None:
+            snapshot = self._capture_resource_snapshot()
+        return snapshot
     
     def _check_and_optimize(self, snapshot: SystemResourceSnapshot):
         """Check resource usage and trigger optimizations if needed"""
         optimizations_triggered = []
+        cpu_percent = snapshot.cpu_percent
+        memory_percent = snapshot.memory_percent
+        disk_usage_percent = snapshot.disk_usage_percent
         
         # Check CPU usage
-        if snapshot.cpu_percent > self.cpu_threshold:
-            logger.warning(f"High CPU usage detected: {snapshot.cpu_percent:.1f}%")
+        if cpu_percent > self.cpu_threshold:
+            logger.warning(f"High CPU usage detected: {cpu_percent:.1f}%")
             optimizations_triggered.append("cpu_optimization")
         
         # Check memory usage
-        if snapshot.memory_percent > self.memory_threshold:
-            logger.warning(f"High memory usage detected: {snapshot.memory_percent:.1f}%")
-            if self.gc_optimization_enabled:
-                self._trigger_garbage_collection()
+        if memory_percent > self.memory_threshold:
+            logger.warning(f"High memory usage detected: {memory_percent:.1f}%")
+            if self.gc_optimization_enabled and self._trigger_garbage_collection():
                 optimizations_triggered.append("garbage_collection")
+        else:
+            self._gc_escalate = False
         
         # Check disk usage
-        if snapshot.disk_usage_percent > self.disk_threshold:
-            logger.warning(f"High disk usage detected: {snapshot.disk_usage_percent:.1f}%")
+        if disk_usage_percent > self.disk_threshold:
+            logger.warning(f"High disk usage detected: {disk_usage_percent:.1f}%")
             optimizations_triggered.append("disk_cleanup")
         
         # Log optimizations
         if optimizations_triggered:
             logger.info(f"Triggered optimizations: {', '.join(optimizations_triggered)}")
     
-    def _trigger_garbage_collection(self):
-        """Trigger garbage collection to free memory"""
+    def _trigger_garbage_collection(self) -> bool:
+        """
+        Trigger garbage collection to free memory
+        
+        Collections are rate limited to one per gc_min_interval. The first one
+        only collects the young generations; a full collection follows if memory
+        is still above the threshold the next time this is triggered.
+        
+        Returns:
+            bool: True if a collection ran
+        """
+        now = time.time()
+        if now - self._last_gc_time < self.gc_min_interval:
+            return False
+        self._last_gc_time = now
+        
+        generation = 2 if self._gc_escalate else 1
+        self._gc_escalate = True
+        
         try:
-            before_memory = psutil.Process().memory_info().rss / (1024 * 1024)
+            before_memory = self._process.memory_info().rss / (1024 * 1024)
             
-            # Force garbage collection
-            collected = gc.collect()
+            collected = gc.collect(generation)
             
-            after_memory = psutil.Process().memory_info().rss / (1024 * 1024)
+            after_memory = self._process.memory_info().rss / (1024 * 1024)
             freed_mb = before_memory - after_memory
             
-            logger.info(f"Garbage collection freed {freed_mb:.1f}MB, collected {collected} objects")
+            logger.info(f"Garbage collection (generation {generation}) freed {freed_mb:.1f}MB, collected {collected} objects")
             
         except Exception as e:
             logger.error(f"Error during garbage collection: {e}")
+        
+        return True
     
     def start_operation(self, operation_type: str, metadata: Optional[Dict[str, Any]] = None) -> str:
         """
@@ -292,10 +605,10 @@ class PerformanceMonitor:
         Returns:
             str: Operation ID for tracking
         """
-        operation_id = f"{operation_type}_{int(time.time() * 1000)}_{id(threading.current_thread())}"
+        operation_id = f"{operation_type}_{next(self._operation_counter)}"
         
-        # Capture initial resource snapshot
-        initial_snapshot = self._capture_resource_snapshot()
+        # Use the latest background snapshot rather than polling the OS per operation
+        initial_snapshot = self._get_latest_snapshot()
         
         metrics = PerformanceMetrics(
             operation_id=operation_id,
@@ -306,8 +619,13 @@ class PerformanceMonitor:
             metadata=metadata or {}
         )
         
-        with self._lock:
-            self.metrics_history.append(metrics)
+        with self._metrics_lock:
+            evicted = self.metrics_history.append(metrics)
+            self._metrics_index[operation_id] = metrics
+            
+            # Drop the index entry of the operation the buffer overwrote
+            if evicted is not None:
+                self._metrics_index.pop(evicted.operation_id, None)
         
         return operation_id
     
@@ -330,20 +648,18 @@ class PerformanceMonitor:
             chunk_count: Number of chunks processed
             error: Exception if operation failed
         """
-        with self._lock:
+        # Latest background snapshot, read outside the lock
+        final_snapshot = self._get_latest_snapshot()
+        
+        with self._metrics_lock:
             # Find the metrics entry
-            metrics = None
-            for m in reversed(self.metrics_history):
-                if m.operation_id == operation_id:
-                    metrics = m
-                    break
+            metrics = self._metrics_index.get(operation_id)
             
             if not metrics:
                 logger.warning(f"Operation ID not found: {operation_id}")
                 return
             
-            # Capture final resource snapshot
-            final_snapshot = self._capture_resource_snapshot()
+            first_completion = metrics.duration is None
             
             # Update metrics
             metrics.complete(error)
@@ -357,8 +673,27 @@ class PerformanceMonitor:
             if metrics.duration and metrics.duration > 0:
                 metrics.memory_usage_mb = final_snapshot.process_memory_mb
                 metrics.cpu_usage_percent = final_snapshot.process_cpu_percent
+            
+            if first_completion:
+                self._add_to_operation_aggregates(metrics)
         
-        logger.debug(f"Completed operation {operation_id} in {metrics.duration:.2f}s")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Completed operation %s in %.2fs", operation_id, metrics.duration)
+    
+    def _add_to_operation_aggregates(self, metrics: PerformanceMetrics):
+        """Add a completed operation to the bucket of its completion time (caller holds the metrics lock)"""
+        bucket_index = int(metrics.end_time // self.aggregate_bucket_seconds)
+        
+        if self._operation_buckets and self._operation_buckets[-1][0] >= bucket_index:
+            bucket = self._operation_buckets[-1][1]
+        else:
+            bucket = {}
+            self._operation_buckets.append((bucket_index, bucket))
+        
+        aggregate = bucket.get(metrics.operation_type)
+        if aggregate is None:
+            aggregate = bucket[metrics.operation_type] = OperationAggregate()
+        aggregate.add(metrics)
     
     def update_cache_stats(self, cache_name: str, hit: bool, access_time_ms: float = 0.0):
         """
@@ -369,11 +704,17 @@ class PerformanceMonitor:
             hit: Whether this was a cache hit or miss
             access_time_ms: Time taken to access cache in milliseconds
         """
-        with self._lock:
-            if cache_name not in self.cache_stats:
-                self.cache_stats[cache_name] = CacheStatistics(cache_name=cache_name)
-            
-            stats = self.cache_stats[cache_name]
+        stats_lock = self._cache_stat_locks.get(cache_name)
+        if stats_lock is None:
+            with self._cache_lock:
+                if cache_name not in self.cache_stats:
+                    self.cache_stats[cache_name] = CacheStatistics(cache_name=cache_name)
+                    self._cache_stat_locks[cache_name] = threading.Lock()
+                stats_lock = self._cache_stat_locks[cache_name]
+        
+        # Only raw counters are updated here; derived rates are computed when read
+        stats = self.cache_stats[cache_name]
+        with stats_lock:
             stats.total_requests += 1
             
             if hit:
@@ -381,97 +722,110 @@ class PerformanceMonitor:
             else:
                 stats.cache_misses += 1
             
-            # Update average access time
-            if access_time_ms > 0:
-                current_total_time = stats.average_access_time_ms * (stats.total_requests - 1)
-                stats.average_access_time_ms = (current_total_time + access_time_ms) / stats.total_requests
-            
-            stats.update_hit_rate()
+            stats.total_access_time_ms += access_time_ms
     
     def get_performance_summary(self, hours: int = 1) -> Dict[str, Any]:
         """
         Get performance summary for the specified time period
         
+        Operation statistics cover operations completed in the period, at the
+        granularity of aggregate_bucket_seconds.
+        
         Args:
             hours: Number of hours to include in summary
             
         Returns:
             dict: Performance summary
         """
-        cutoff_time = time.time() - (hours * 3600)
-        
-        with self._lock:
-            # Filter recent metrics
-            recent_metrics = [m for m in self.metrics_history 
-                            if m.start_time >= cutoff_time and m.duration is not None]
-            
-            # Filter recent resource snapshots
-            recent_resources = [r for r in self.resource_history 
-                              if r.timestamp >= cutoff_time]
-        
-        if not recent_metrics:
+        now = time.time()
+        cutoff_time = now - (hours * 3600)
+        cutoff_bucket = int(cutoff_time // self.aggregate_bucket_seconds)
+        
+        with self._metrics_lock:
+            # Merge the per-type totals of buckets inside the period
+            aggregates: Dict[str, OperationAggregate] = {}
+            for bucket_index, bucket in reversed(self._operation_buckets):
+                if bucket_index < cutoff_bucket:
+                    break
+                for op_type, bucket_aggregate in bucket.items():
+                    aggregate = aggregates.get(op_type)
+                    if aggregate is None:
+                        aggregate = aggregates[op_type] = OperationAggregate()
+                    aggregate.merge(bucket_aggregate)
+        
+        with self._resource_lock:
+            # Snapshots are appended in time order, so binary search for the cutoff
+            first_recent = self.resource_history.bisect_left(cutoff_time, key=_snapshot_timestamp)
+            recent_resources = self.resource_history.to_list(first_recent)
+        
+        total_operations = sum(aggregate.count for aggregate in aggregates.values())
+        if not total_operations:
             return {"error": "No performance data available for the specified period"}
         
-        # Calculate operation statistics
-        operation_stats = defaultdict(list)
-        for metrics in recent_metrics:
-            operation_stats[metrics.operation_type].append(metrics)
-        
         # Aggregate statistics by operation type
-        aggregated_stats = {}
-        for op_type, metrics_list in operation_stats.items():
-            durations = [m.duration for m in metrics_list if m.duration]
-            memory_usage = [m.memory_usage_mb for m in metrics_list]
-            cache_hits = sum(m.cache_hits for m in metrics_list)
-            cache_misses = sum(m.cache_misses for m in metrics_list)
-            errors = sum(1 for m in metrics_list if m.error_occurred)
-            
-            aggregated_stats[op_type] = {
-                "count": len(metrics_list),
-                "avg_duration": sum(durations) / len(durations) if durations else 0,
-                "max_duration": max(durations) if durations else 0,
-                "min_duration": min(durations) if durations else 0,
-                "avg_memory_mb": sum(memory_usage) / len(memory_usage) if memory_usage else 0,
-                "total_cache_hits": cache_hits,
-                "total_cache_misses": cache_misses,
-                "cache_hit_rate": cache_hits / (cache_hits + cache_misses) if (cache_hits + cache_misses) > 0 else 0,
-                "error_count": errors,
-                "error_rate": errors / len(metrics_list) if metrics_list else 0
-            }
+        aggregated_stats = {op_type: aggregate.to_summary() for op_type, aggregate in aggregates.items()}
         
         # Calculate resource statistics
         resource_stats = {}
         if recent_resources:
-            cpu_values = [r.cpu_percent for r in recent_resources]
-            memory_values = [r.memory_percent for r in recent_resources]
-            process_memory_values = [r.process_memory_mb for r in recent_resources]
+            # Single pass over the snapshots, no per-field value lists
+            cpu_sum = memory_sum = process_memory_sum = 0.0
+            max_cpu = max_memory = max_process_memory = -math.inf
+            for r in recent_resources:
+                cpu = r.cpu_percent
+                memory_percent = r.memory_percent
+                process_memory = r.process_memory_mb
+                cpu_sum += cpu
+                memory_sum += memory_percent
+                process_memory_sum += process_memory
+                if cpu > max_cpu:
+                    max_cpu = cpu
+                if memory_percent > max_memory:
+                    max_memory = memory_percent
+                if process_memory > max_process_memory:
+                    max_process_memory = process_memory
             
+            snapshot_count = len(recent_resources)
             resource_stats = {
-                "avg_cpu_percent": sum(cpu_values) / len(cpu_values),
-                "max_cpu_percent": max(cpu_values),
-                "avg_memory_percent": sum(memory_values) / len(memory_values),
-                "max_memory_percent": max(memory_values),
-                "avg_process_memory_mb": sum(process_memory_values) / len(process_memory_values),
-                "max_process_memory_mb": max(process_memory_values),
+                "avg_cpu_percent": cpu_sum / snapshot_count,
+                "max_cpu_percent": max_cpu,
+                "avg_memory_percent": memory_sum / snapshot_count,
+                "max_memory_percent": max_memory,
+                "avg_process_memory_mb": process_memory_sum / snapshot_count,
+                "max_process_memory_mb": max_process_memory,
                 "current_memory_available_mb": recent_resources[-1].memory_available_mb,
                 "current_disk_free_gb": recent_resources[-1].disk_free_gb
             }
         
         # Get cache statistics
         cache_summary = {}
-        for cache_name, stats in self.cache_stats.items():
-            cache_summary[cache_name] = stats.to_dict()
+        with self._cache_lock:
+            cache_entries = [(stats, self._cache_stat_locks[name]) for name, stats in self.cache_stats.items()]
+        
+        for stats, stats_lock in cache_entries:
+            with stats_lock:
+                stats.update_hit_rate()
+                stats.update_average_access_time()
+                cache_summary[stats.cache_name] = stats.to_dict()
         
         return {
             "time_period_hours": hours,
-            "total_operations": len(recent_metrics),
+            "total_operations": total_operations,
             "operation_statistics": aggregated_stats,
             "resource_statistics": resource_stats,
             "cache_statistics": cache_summary,
             "queue_metrics": {name: metrics.to_dict() for name, metrics in self.queue_metrics.items()},
-            "generated_at": datetime.now().isoformat()
+            "generated_at": self._generated_at_isoformat(now)
         }
     
+    def _generated_at_isoformat(self, now: float) -> str:
+        """Whole-second ISO timestamp for summaries, formatted at most once per second"""
+        second = int(now)
+        cached = self._generated_at_cache
+        if cached is None or second != cached[0]:
+            cached = self._generated_at_cache = (second, datetime.fromtimestamp(second).isoformat())
+        return cached[1]
+    
     def get_optimization_recommendations(self) -> List[Dict[str, Any]]:
         """
         Generate optimization recommendations based on performance data
@@ -581,13 +935,14 @@ class PerformanceMonitor:
         
         return recommendations
     
-    def export_metrics(self, filepath: str, hours: int = 24):
+    def export_metrics(self, filepath: str, hours: int = 24, indent: Optional[int] = None):
         """
         Export performance metrics to a file
         
         Args:
             filepath: Path to export file
             hours: Number of hours of data to export
+            indent: JSON indentation; compact output (the default) uses the C encoder
         """
         try:
             summary = self.get_performance_summary(hours)
@@ -606,8 +961,10 @@ class PerformanceMonitor:
                 }
             }
             
+            # json.dump always encodes in pure Python; dumps without indent takes the C fast path.
+            # The export only holds aggregates, so encoding it in one piece is cheap.
             with open(filepath, 'w') as f:
-                json.dump(export_data, f, indent=2, default=str)
+                f.write(json.dumps(export_data, indent=indent, default=str))
             
             logger.info(f"Performance metrics exported to {filepath}")
             
@@ -12,8 +12,9 @@ import os
 import logging
 import threading
 from typing import Dict, List, Any, Optional, Callable
-from datetime import datetime, timedelta
-from collections import deque, defaultdict
+from datetime import datetime
+from collections import OrderedDict, deque, defaultdict
+from functools import lru_cache, wraps
 import gc
 
 # Configure logging first
@@ -27,6 +28,43 @@ except ImportError:
     PSUTIL_AVAILABLE = False
     logger.warning("psutil not available, memory monitoring will be limited")
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+def _timestamp_to_epoch(timestamp: Any) -> Optional[float]:
+    """
+    Convert an ISO message timestamp to epoch seconds
+    
+    Timestamps come from the client and may be any JSON value; anything
+    that isn't a string is rejected here, before it reaches the cache.
+    
+    Returns:
+        Epoch seconds, or None if the timestamp can't be parsed
+    """
+    if not isinstance(timestamp, str):
+        return None
+    return _parse_iso_timestamp(timestamp)
+
+@lru_cache(maxsize=4096)
+def _parse_iso_timestamp(timestamp: str) -> Optional[float]:
+    """
+    Parse an ISO timestamp string to epoch seconds
+    
+    Clients resend the whole conversation on every request, so the same
+    timestamps are parsed over and over; results are memoized.
+    
+    Returns:
+        Epoch seconds, or None if the timestamp can't be parsed
+    """
+    try:
+        # Naive timestamps are local time, matching datetime.now()
+        return datetime.fromisoformat(timestamp.replace('Z', '+00:00')).timestamp()
+    except ValueError:
+        return None
+
 class PerformanceMetrics:
     """Track and manage performance metrics"""
     
@@ -36,16 +74,47 @@ class PerformanceMetrics:
         self.file_operations = deque(maxlen=50)  # Keep last 50 file operation times
         self.conversation_stats = defaultdict(int)
         self.start_time = time.time()
-        self._lock = threading.Lock()
+        # One lock per stream so recording one kind of metric never waits on another
+        self._rt_lock = threading.Lock()
+        self._mem_lock = threading.Lock()
+        self._file_lock = threading.Lock()
+        self._conv_lock = threading.Lock()
+        
+        # Running totals over the bounded deques so summaries don't rescan them
+        self._response_time_sum = 0.0
+        self._response_time_max = 0.0
+        self._memory_rss_sum = 0
+        self._file_duration_sum = 0.0
+    
+    @staticmethod
+    def _append_bounded(buffer: deque, entry: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Append to a bounded deque, returning the entry it evicted (caller holds its lock)"""
+        evicted = buffer[0] if len(buffer) == buffer.maxlen else None
+        buffer.append(entry)
+        return evicted
     
     def record_response_time(self, endpoint: str, duration: float):
         """Record response time for an endpoint"""
-        with self._lock:
-            self.response_times.append({
-                'endpoint': endpoint,
-                'duration': duration,
-                'timestamp': time.time()
-            })
+        entry = {
+            'endpoint': endpoint,
+            'duration': duration,
+            'timestamp': time.time()
+        }
+        with self._rt_lock:
+            evicted = self._append_bounded(self.response_times, entry)
+            self._response_time_sum += duration
+            if evicted is not None:
+                self._response_time_sum -= evicted['duration']
+                if evicted['duration'] >= self._response_time_max:
+                    # The maximum may have left the window; rescan the bounded deque
+                    self._response_time_max = max(r['duration'] for r in self.response_times)
+            if duration > self._response_time_max:
+                self._response_time_max = duration
+    
+    def increment_conversation_stat(self, key: str, amount: int = 1):
+        """Increment a conversation counter"""
+        with self._conv_lock:
+            self.conversation_stats[key] += amount
     
     def record_memory_usage(self):
         """Record current memory usage"""
@@ -53,71 +122,88 @@ class PerformanceMetrics:
             if PSUTIL_AVAILABLE:
                 process = psutil.Process()
                 memory_info = process.memory_info()
-                with self._lock:
-                    self.memory_usage.append({
-                        'rss': memory_info.rss,
-                        'vms': memory_info.vms,
-                        'timestamp': time.time()
-                    })
+                entry = {
+                    'rss': memory_info.rss,
+                    'vms': memory_info.vms,
+                    'timestamp': time.time()
+                }
             else:
                 # Fallback to basic memory info if available
                 import resource
                 memory_usage = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
-                with self._lock:
-                    self.memory_usage.append({
-                        'rss': memory_usage * 1024,  # Convert to bytes on Unix
-                        'vms': 0,
-                        'timestamp': time.time()
-                    })
+                entry = {
+                    'rss': memory_usage * 1024,  # Convert to bytes on Unix
+                    'vms': 0,
+                    'timestamp': time.time()
+                }
+            
+            with self._mem_lock:
+                evicted = self._append_bounded(self.memory_usage, entry)
+                self._memory_rss_sum += entry['rss']
+                if evicted is not None:
+                    self._memory_rss_sum -= evicted['rss']
         except Exception as e:
             logger.warning(f"Failed to record memory usage: {e}")
     
     def record_file_operation(self, operation: str, duration: float, file_size: int = 0):
         """Record file operation performance"""
-        with self._lock:
-            self.file_operations.append({
-                'operation': operation,
-                'duration': duration,
-                'file_size': file_size,
-                'timestamp': time.time()
-            })
+        entry = {
+            'operation': operation,
+            'duration': duration,
+            'file_size': file_size,
+            'timestamp': time.time()
+        }
+        with self._file_lock:
+            evicted = self._append_bounded(self.file_operations, entry)
+            self._file_duration_sum += duration
+            if evicted is not None:
+                self._file_duration_sum -= evicted['duration']
     
     def get_performance_summary(self) -> Dict[str, Any]:
         """Get comprehensive performance summary"""
-        with self._lock:
-            # Calculate response time statistics
-            response_durations = [r['duration'] for r in self.response_times]
-            avg_response_time = sum(response_durations) / len(response_durations) if response_durations else 0
-            max_response_time = max(response_durations) if response_durations else 0
-            
-            # Calculate memory statistics
-            if self.memory_usage:
-                current_memory = self.memory_usage[-1]['rss'] / 1024 / 1024  # MB
-                avg_memory = sum(m['rss'] for m in self.memory_usage) / len(self.memory_usage) / 1024 / 1024
-            else:
-                current_memory = avg_memory = 0
-            
-            # Calculate file operation statistics
-            file_durations = [f['duration'] for f in self.file_operations]
-            avg_file_time = sum(file_durations) / len(file_durations) if file_durations else 0
-            
-            return {
-                'uptime_seconds': time.time() - self.start_time,
-                'response_times': {
-                    'average': avg_response_time,
-                    'maximum': max_response_time,
-                    'count': len(self.response_times)
-                },
-                'memory_usage': {
-                    'current_mb': current_memory,
-                    'average_mb': avg_memory
-                },
-                'file_operations': {
-                    'average_duration': avg_file_time,
-                    'count': len(self.file_operations)
-                },
-                'conversation_stats': dict(self.conversation_stats)
-            }
+        # Read the running totals under the stream locks (always taken in this
+        # order), compute without holding them
+        with self._rt_lock, self._mem_lock, self._file_lock, self._conv_lock:
+            response_count = len(self.response_times)
+            response_time_sum = self._response_time_sum
+            max_response_time = self._response_time_max if response_count else 0
+            memory_count = len(self.memory_usage)
+            memory_rss_sum = self._memory_rss_sum
+            current_rss = self.memory_usage[-1]['rss'] if memory_count else 0
+            file_count = len(self.file_operations)
+            file_duration_sum = self._file_duration_sum
+            conversation_stats = dict(self.conversation_stats)
+        
+        # Calculate response time statistics
+        avg_response_time = response_time_sum / response_count if response_count else 0
+        
+        # Calculate memory statistics
+        if memory_count:
+            current_memory = current_rss / 1024 / 1024  # MB
+            avg_memory = memory_rss_sum / memory_count / 1024 / 1024
+        else:
+            current_memory = avg_memory = 0
+        
+        # Calculate file operation statistics
+        avg_file_time = file_duration_sum / file_count if file_count else 0
+        
+        return {
+            'uptime_seconds': time.time() - self.start_time,
+            'response_times': {
+                'average': avg_response_time,
+                'maximum': max_response_time,
+                'count': response_count
+            },
+            'memory_usage': {
+                'current_mb': current_memory,
+                'average_mb': avg_memory
+            },
+            'file_operations': {
+                'average_duration': avg_file_time,
+                'count': file_count
+            },
+            'conversation_stats': conversation_stats
+        }
 
 class ConversationHistoryManager:
     """Manage conversation history with limits and cleanup"""
@@ -148,18 +234,15 @@ class ConversationHistoryManager:
             return conversation_history
         
         # Remove messages older than max_age_hours
-        cutoff_time = datetime.now() - timedelta(hours=self.max_age_hours)
+        cutoff_epoch = time.time() - self.max_age_hours * 3600
         cleaned_history = []
         
         for message in conversation_history:
             # Check if message has timestamp
             if 'timestamp' in message:
-                try:
-                    msg_time = datetime.fromisoformat(message['timestamp'].replace('Z', '+00:00'))
-                    if msg_time > cutoff_time:
-                        cleaned_history.append(message)
-                except (ValueError, TypeError):
-                    # If timestamp parsing fails, keep the message
+                msg_epoch = _timestamp_to_epoch(message['timestamp'])
+                # If timestamp parsing fails, keep the message
+                if msg_epoch is None or msg_epoch > cutoff_epoch:
                     cleaned_history.append(message)
             else:
                 # If no timestamp, keep the message but add current timestamp
@@ -168,28 +251,8 @@ class ConversationHistoryManager:
         
         # Limit number of messages
         if len(cleaned_history) > self.max_messages:
-            # Keep the most recent messages, but preserve conversation flow
-            # Always keep pairs of user/assistant messages together
-            messages_to_keep = self.max_messages
-            result = []
-            
-            # Start from the end and work backwards
-            i = len(cleaned_history) - 1
-            while i >= 0 and len(result) < messages_to_keep:
-                message = cleaned_history[i]
-                result.insert(0, message)
-                
-                # If this is an assistant message, try to keep the preceding user message
-                if (message.get('role') == 'assistant' and 
-                    i > 0 and 
-                    cleaned_history[i-1].get('role') == 'user' and 
-                    len(result) < messages_to_keep):
-                    result.insert(0, cleaned_history[i-1])
-                    i -= 1
-                
-                i -= 1
-            
-            cleaned_history = result
+            # Keep the most recent messages as one contiguous tail so conversation flow is preserved
+            cleaned_history = cleaned_history[-self.max_messages:]
         
         logger.info(f"Cleaned conversation history: {len(conversation_history)} -> {len(cleaned_history)} messages")
         return cleaned_history
@@ -210,29 +273,35 @@ class ConversationHistoryManager:
                 'newest_message': None
             }
         
-        user_count = sum(1 for msg in conversation_history if msg.get('role') == 'user')
-        assistant_count = sum(1 for msg in conversation_history if msg.get('role') == 'assistant')
-        total_chars = sum(len(msg.get('content', '')) for msg in conversation_history)
+        # Single pass over the history
+        user_count = 0
+        assistant_count = 0
+        total_chars = 0
+        oldest_epoch = newest_epoch = None
+        oldest_ts = newest_ts = None
         
-        # Find oldest and newest messages with timestamps
-        timestamped_messages = [msg for msg in conversation_history if 'timestamp' in msg]
-        oldest = newest = None
+        for msg in conversation_history:
+            role = msg.get('role')
+            if role == 'user':
+                user_count += 1
+            elif role == 'assistant':
+                assistant_count += 1
+            total_chars += len(msg.get('content', ''))
+            
+            # Track oldest and newest messages with parseable timestamps
+            if 'timestamp' in msg:
+                epoch = _timestamp_to_epoch(msg['timestamp'])
+                if epoch is None:
+                    continue
+                if oldest_epoch is None or epoch < oldest_epoch:
+                    oldest_epoch, oldest_ts = epoch, msg['timestamp']
+                if newest_epoch is None or epoch > newest_epoch:
+                    newest_epoch, newest_ts = epoch, msg['timestamp']
         
-        if timestamped_messages:
-            try:
-                timestamps = []
-                for msg in timestamped_messages:
-                    try:
-                        ts = datetime.fromisoformat(msg['timestamp'].replace('Z', '+00:00'))
-                        timestamps.append(ts)
-                    except (ValueError, TypeError):
-                        continue
-                
-                if timestamps:
-                    oldest = min(timestamps).isoformat()
-                    newest = max(timestamps).isoformat()
-            except Exception as e:
-                logger.warning(f"Error calculating message timestamps: {e}")
+        oldest = newest = None
+        if oldest_ts is not None:
+            oldest = datetime.fromisoformat(oldest_ts.replace('Z', '+00:00')).isoformat()
+            newest = datetime.fromisoformat(newest_ts.replace('Z', '+00:00')).isoformat()
         
         return {
             'total_messages': len(conversation_history),
@@ -247,9 +316,7 @@ class FileOperationOptimizer:
     """Optimize file I/O operations for better performance"""
     
     def __init__(self):
-        self.file_cache = {}
-        self.cache_timestamps = {}
-        self.cache_max_age = 300  # 5 minutes
+        self.file_cache: "OrderedDict[str, tuple]" = OrderedDict()  # path -> (data, cached_at, mtime_ns, size), LRU order
         self.cache_max_size = 10  # Maximum number of cached files
         self._lock = threading.Lock()
     
@@ -257,55 +324,57 @@ class FileOperationOptimizer:
         """
         Read file with caching to improve performance
         
+        Cached data stays valid for as long as the file's modification time
+        and size are unchanged, so an unmodified file is never parsed twice.
+        
         Args:
             file_path: Path to file to read
-            max_age_seconds: Maximum age of cached data in seconds
+            max_age_seconds: Unused; kept for backwards compatibility
             
         Returns:
-            File content as dictionary or None if file doesn't exist
+            File content as dictionary or None if file doesn't exist.
+            The dictionary is the cached object itself, not a copy, and is
+            shared with other readers; callers must not modify it and should
+            deep-copy it before making changes.
         """
-        max_age = max_age_seconds or self.cache_max_age
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            return None
         
+        # Only the cache lookup is locked; reads of different files proceed in parallel
         with self._lock:
-            # Check if file is in cache and still valid
-            if (file_path in self.file_cache and 
-                file_path in self.cache_timestamps and
-                time.time() - self.cache_timestamps[file_path] < max_age):
-                
-                # Verify file hasn't been modified
-                try:
-                    if os.path.exists(file_path):
-                        file_mtime = os.path.getmtime(file_path)
-                        if file_mtime <= self.cache_timestamps[file_path]:
-                            logger.debug(f"Using cached data for {file_path}")
-                            return self.file_cache[file_path].copy()
-                except OSError:
-                    pass
+            # Check if file is in cache and unchanged on disk
+            cached = self.file_cache.get(file_path)
+            if cached is not None and cached[2] == stat.st_mtime_ns and cached[3] == stat.st_size:
+                logger.debug(f"Using cached data for {file_path}")
+                self.file_cache.move_to_end(file_path)
+                return cached[0]
+        
+        # Read file and update cache
+        try:
+            start_time = time.time()
+            # Read the whole file in one call and parse the bytes directly
+            with open(file_path, 'rb') as f:
+                raw = f.read()
+            data = orjson.loads(raw) if ORJSON_AVAILABLE else json.loads(raw)
             
-            # Read file and update cache
-            try:
-                if not os.path.exists(file_path):
-                    return None
-                
-                start_time = time.time()
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                
-                duration = time.time() - start_time
-                file_size = os.path.getsize(file_path)
-                
-                # Update cache
-                self._update_cache(file_path, data)
-                
-                # Record performance metrics
-                performance_metrics.record_file_operation('read', duration, file_size)
-                
-                logger.debug(f"Read and cached {file_path} ({file_size} bytes in {duration:.3f}s)")
-                return data
-                
-            except Exception as e:
-                logger.error(f"Error reading file {file_path}: {e}")
-                return None
+            duration = time.time() - start_time
+            file_size = stat.st_size
+            
+            # Update cache; a concurrent read of the same file may overwrite it with equal data
+            with self._lock:
+                self._update_cache(file_path, data, stat)
+            
+            # Record performance metrics
+            performance_metrics.record_file_operation('read', duration, file_size)
+            
+            logger.debug(f"Read and cached {file_path} ({file_size} bytes in {duration:.3f}s)")
+            return data
+            
+        except Exception as e:
+            logger.error(f"Error reading file {file_path}: {e}")
+            return None
     
     def optimized_file_write(self, file_path: str, data: Dict[str, Any], 
                            create_backup: bool = True) -> bool:
@@ -314,7 +383,8 @@ class FileOperationOptimizer:
         
         Args:
             file_path: Path to file to write
-            data: Data to write
+            data: Data to write; it is cached as-is, so callers must not
+                modify it afterwards
             create_backup: Whether to create backup before writing
             
         Returns:
@@ -332,27 +402,30 @@ class FileOperationOptimizer:
                 except Exception as e:
                     logger.warning(f"Failed to create backup: {e}")
             
-            # Write to temporary file first
-            temp_path = f"{file_path}.tmp"
-            with open(temp_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            # Serialize in memory first; this raises before anything touches the disk
+            if ORJSON_AVAILABLE:
+                blob = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+            else:
+                blob = json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
             
-            # Verify written data
-            with open(temp_path, 'r', encoding='utf-8') as f:
-                json.load(f)  # This will raise an exception if JSON is invalid
+            # Write to temporary file first and flush it to disk before the rename
+            temp_path = f"{file_path}.tmp"
+            with open(temp_path, 'wb') as f:
+                f.write(blob)
+                f.flush()
+                os.fsync(f.fileno())
+                # Stat what this process wrote; after the rename another writer may have replaced it
+                stat = os.fstat(f.fileno())
             
-            # Atomic rename
-            if os.name == 'nt':  # Windows
-                if os.path.exists(file_path):
-                    os.remove(file_path)
-            os.rename(temp_path, file_path)
+            # Atomic rename; os.replace overwrites the target on Windows too
+            os.replace(temp_path, file_path)
             
             duration = time.time() - start_time
-            file_size = os.path.getsize(file_path)
+            file_size = stat.st_size
             
             # Update cache
             with self._lock:
-                self._update_cache(file_path, data)
+                self._update_cache(file_path, data, stat)
             
             # Record performance metrics
             performance_metrics.record_file_operation('write', duration, file_size)
@@ -371,24 +444,20 @@ class FileOperationOptimizer:
                     pass
             return False
     
-    def _update_cache(self, file_path: str, data: Dict[str, Any]):
-        """Update file cache with new data"""
-        # Remove oldest entries if cache is full
-        if len(self.file_cache) >= self.cache_max_size:
-            oldest_file = min(self.cache_timestamps.keys(), 
-                            key=lambda k: self.cache_timestamps[k])
-            del self.file_cache[oldest_file]
-            del self.cache_timestamps[oldest_file]
-        
-        # Add new data to cache
-        self.file_cache[file_path] = data.copy()
-        self.cache_timestamps[file_path] = time.time()
+    def _update_cache(self, file_path: str, data: Dict[str, Any], stat: os.stat_result):
+        """Update file cache with new data and the file stat it corresponds to"""
+        # Add new data to cache as the most recently used entry
+        self.file_cache[file_path] = (data, time.time(), stat.st_mtime_ns, stat.st_size)
+        self.file_cache.move_to_end(file_path)
+        
+        # Remove least recently used entries if cache is full
+        while len(self.file_cache) > self.cache_max_size:
+            self.file_cache.popitem(last=False)
     
     def clear_cache(self):
         """Clear file cache"""
         with self._lock:
             self.file_cache.clear()
-            self.cache_timestamps.clear()
         logger.info("File cache cleared")
     
     def get_cache_stats(self) -> Dict[str, Any]:
@@ -397,28 +466,48 @@ class FileOperationOptimizer:
             return {
                 'cached_files': len(self.file_cache),
                 'cache_max_size': self.cache_max_size,
-                'cache_max_age': self.cache_max_age,
-                'oldest_cache_age': time.time() - min(self.cache_timestamps.values()) if self.cache_timestamps else 0
+                'oldest_cache_age': time.time() - min(entry[1] for entry in self.file_cache.values()) if self.file_cache else 0
             }
 
 class ResponseTimeMonitor:
     """Monitor and optimize response times"""
     
+    # Endpoint keyword -> suggestions, checked in order; shared by every suggestion
+    SUGGESTION_TEMPLATES = (
+        ('chat', (
+            'Consider implementing conversation history limits',
+            'Add response streaming for better perceived performance',
+            'Optimize AI model parameters for faster responses'
+        )),
+        ('memory', (
+            'Implement memory file caching',
+            'Consider background processing for insight extraction',
+            'Optimize JSON parsing and file I/O operations'
+        )),
+        ('serendipity', (
+            'Cache serendipity analysis results',
+            'Implement progressive analysis for large datasets',
+            'Consider background processing for complex analysis'
+        ))
+    )
+    
     def __init__(self):
         self.slow_request_threshold = 5.0  # seconds
         self.very_slow_threshold = 10.0    # seconds
-        self.optimization_suggestions = []
+        self.optimization_suggestions = deque(maxlen=200)  # Ordered by timestamp
     
     def monitor_request(self, func: Callable) -> Callable:
         """Decorator to monitor request response times"""
+        endpoint = getattr(func, '__name__', 'unknown')
+        
+        @wraps(func)
         def wrapper(*args, **kwargs):
-            start_time = time.time()
+            start_time = time.perf_counter()
             try:
                 result = func(*args, **kwargs)
-                duration = time.time() - start_time
+                duration = time.perf_counter() - start_time
                 
                 # Record metrics
-                endpoint = getattr(func, '__name__', 'unknown')
                 performance_metrics.record_response_time(endpoint, duration)
                 
                 # Check for slow requests
@@ -432,7 +521,7 @@ class ResponseTimeMonitor:
                 return result
                 
             except Exception as e:
-                duration = time.time() - start_time
+                duration = time.perf_counter() - start_time
                 logger.error(f"Request failed after {duration:.2f}s: {e}")
                 raise
         
@@ -440,45 +529,31 @@ class ResponseTimeMonitor:
     
     def _suggest_optimization(self, endpoint: str, duration: float, severity: str):
         """Generate optimization suggestions for slow requests"""
+        endpoint_lower = endpoint.lower()
+        tips = ()
+        for keyword, keyword_tips in self.SUGGESTION_TEMPLATES:
+            if keyword in endpoint_lower:
+                tips = keyword_tips
+                break
+        
         suggestion = {
             'endpoint': endpoint,
             'duration': duration,
             'severity': severity,
             'timestamp': time.time(),
-            'suggestions': []
+            'suggestions': tips
         }
         
-        if 'chat' in endpoint.lower():
-            suggestion['suggestions'].extend([
-                'Consider implementing conversation history limits',
-                'Add response streaming for better perceived performance',
-                'Optimize AI model parameters for faster responses'
-            ])
-        elif 'memory' in endpoint.lower():
-            suggestion['suggestions'].extend([
-                'Implement memory file caching',
-                'Consider background processing for insight extraction',
-                'Optimize JSON parsing and file I/O operations'
-            ])
-        elif 'serendipity' in endpoint.lower():
-            suggestion['suggestions'].extend([
-                'Cache serendipity analysis results',
-                'Implement progressive analysis for large datasets',
-                'Consider background processing for complex analysis'
-            ])
-        
         self.optimization_suggestions.append(suggestion)
         
-        # Keep only recent suggestions
+        # Keep only recent suggestions; the oldest are always at the left
         cutoff_time = time.time() - 3600  # 1 hour
-        self.optimization_suggestions = [
-            s for s in self.optimization_suggestions 
-            if s['timestamp'] > cutoff_time
-        ]
+        while self.optimization_suggestions and self.optimization_suggestions[0]['timestamp'] <= cutoff_time:
+            self.optimization_suggestions.popleft()
     
     def get_optimization_suggestions(self) -> List[Dict[str, Any]]:
         """Get current optimization suggestions"""
-        return self.optimization_suggestions.copy()
+        return list(self.optimization_suggestions)
 
 # Global instances
 performance_metrics = PerformanceMetrics()
@@ -486,11 +561,17 @@ conversation_manager = ConversationHistoryManager()
 file_optimizer = FileOperationOptimizer()
 response_monitor = ResponseTimeMonitor()
 
-def cleanup_system_resources():
-    """Perform system-wide cleanup to free resources"""
+def cleanup_system_resources(full_collection: bool = False):
+    """
+    Perform system-wide cleanup to free resources
+    
+    Args:
+        full_collection: Collect all three GC generations instead of only the
+            young ones; this pauses every thread for longer
+    """
     try:
-        # Force garbage collection
-        gc.collect()
+        # Young generations hold most of the garbage and are much cheaper to scan
+        gc.collect(2 if full_collection else 1)
         
         # Clear file cache
         file_optimizer.clear_cache()
@@ -513,19 +594,39 @@ def get_performance_status() -> Dict[str, Any]:
     }
 
 # Background cleanup thread
+_cleanup_shutdown = threading.Event()
+_cleanup_thread = None
+_cleanup_thread_lock = threading.Lock()
+
 def start_background_cleanup():
-    """Start background thread for periodic cleanup"""
-    def cleanup_worker():
-        while True:
-            try:
-                time.sleep(300)  # Run every 5 minutes
-                cleanup_system_resources()
-            except Exception as e:
-                logger.error(f"Background cleanup error: {e}")
+    """Start background thread for periodic cleanup, unless it is already running"""
+    global _cleanup_thread
     
-    cleanup_thread = threading.Thread(target=cleanup_worker, daemon=True)
-    cleanup_thread.start()
-    logger.info("Background cleanup thread started")
+    with _cleanup_thread_lock:
+        if _cleanup_thread is not None and _cleanup_thread.is_alive():
+            if not _cleanup_shutdown.is_set():
+                logger.debug("Background cleanup thread already running")
+                return
+            # A stopped thread may still be finishing its last run
+            _cleanup_thread.join()
+        
+        _cleanup_shutdown.clear()
+        
+        def cleanup_worker():
+            runs = 0
+            # Run every 5 minutes until stop_background_cleanup() is called
+            while not _cleanup_shutdown.wait(300):
+                try:
+                    runs += 1
+                    # Full collection only every 30 minutes
+                    cleanup_system_resources(full_collection=runs % 6 == 0)
+                except Exception as e:
+                    logger.error(f"Background cleanup error: {e}")
+        
+        _cleanup_thread = threading.Thread(target=cleanup_worker, daemon=True)
+        _cleanup_thread.start()
+        logger.info("Background cleanup thread started")
 
-# Initialize background cleanup
-start_background_cleanup()
\ No newline at end of file
+def stop_background_cleanup():
+    """Signal the background cleanup thread to exit"""
+    _cleanup_shutdown.set()
@@ -5,17 +5,101 @@ This module provides system prompt management functionality including
 loading, saving, validation, and testing of custom system prompts.
 """
 
+import copy
 import json
 import os
+import re
 import logging
-from typing import Dict, Any, Optional, List
+import threading
+import time
+from typing import Dict, Any, Optional, List, Iterator
 from datetime import datetime
 from ai_service import get_ai_service, AIServiceError
+from config import get_config
+
+# Optional fast JSON backend
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Instructions that are rejected in custom prompts, matched in a single pass
+_PROBLEMATIC_PATTERNS = (
+    "ignore previous instructions",
+    "forget everything",
+    "act as if you are",
+    "pretend to be"
+)
+_PROBLEMATIC_RE = re.compile("|".join(map(re.escape, _PROBLEMATIC_PATTERNS)), re.IGNORECASE)
+# Bytes variant for ASCII prompts, which skips Unicode case folding
+_PROBLEMATIC_BYTES_RE = re.compile(_PROBLEMATIC_RE.pattern.encode('ascii'), re.IGNORECASE)
+
+# Built-in prompt used until a custom one is saved
+_DEFAULT_PROMPT = """You are Synapse, a private, local-first Cognitive Partner. Your sole purpose is to help the user clarify their own thinking, acting as a sounding board and a mirror for their mind, not as an assistant, search engine, or therapist. Your prime directive is to facilitate the user's journey to their own insights by asking better questions rather than providing answers. Adhere strictly to your guiding principles: maintain intellectual honesty over agreement by respectfully challenging assumptions; prioritize Socratic questioning over giving advice; and ground all your analysis in the user's reality, using only the information they have provided. 
+
+**CRITICAL: Always format your responses using proper Markdown syntax. Never use HTML entities.**
+
+Markdown formatting requirements:
+- Use "# " for main headings and "## " for subheadings
+- Create bulleted lists with "* " at the start of each line
+- Use "**text**" for bold emphasis on key concepts  
+- Use "> " for blockquotes and important reflections
+- Use blank lines to separate paragraphs
+- Put each list item on its own line
+- Add line breaks between different sections
+- Never use HTML entities like &gt; or &lt; - always use the actual characters
+
+Before responding, follow your internal monologue: deconstruct the user's message, consult your principles, synthesize with long-term memory, formulate a non-judgmental, open-ended question, and review to ensure you are not giving a direct answer. You are strictly prohibited from giving advice, inventing external facts, or claiming to be a professional. Your voice is that of a patient, curious, and deeply analytical partner—warm and encouraging, yet always intellectually rigorous, giving the user the space to think without rushing to fill the void."""
+
+def _json_loads(raw: bytes) -> Any:
+    """Parse JSON from bytes, using orjson when it is installed"""
+    return orjson.loads(raw) if ORJSON_AVAILABLE else json.loads(raw)
+
+def _json_dumps(data: Any, pretty: bool = False) -> bytes:
+    """Serialize to UTF-8 JSON bytes, using orjson when it is installed"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if pretty else 0)
+    if pretty:
+        return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode('utf-8')
+
+def _atomic_write(file_path: str, payload: bytes) -> os.stat_result:
+    """
+    Write bytes to a temporary file and swap it into place, so readers never see a partial file
+    
+    Returns:
+        os.stat_result: Status of the written file, taken before it was swapped
+        in so a concurrent writer in another process can't be mistaken for it
+    """
+    temp_path = f"{file_path}.tmp"
+    try:
+        with open(temp_path, 'wb') as f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+            stat = os.fstat(f.fileno())
+        os.replace(temp_path, file_path)
+        return stat
+    except Exception:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+_iso_now_cache = (None, "")
+
+def _iso_now() -> str:
+    """Current local time as a whole-second ISO string, formatted at most once per second"""
+    global _iso_now_cache
+    now_ns = time.time_ns()
+    second = now_ns // 1_000_000_000
+    cached = _iso_now_cache
+    if cached[0] != second:
+        cached = _iso_now_cache = (second, datetime.fromtimestamp(second).isoformat())
+    return cached[1]
+
 class PromptServiceError(Exception):
     """Custom exception for prompt service errors"""
     pass
@@ -25,66 +109,232 @@ class PromptService:
     Service for managing system prompt configuration and validation
     """
     
-    def __init__(self, config_file: str = "prompt_config.json"):
+    default_prompt = _DEFAULT_PROMPT
+    
+    # Maximum number of history entries shown and kept; default prompts are never dropped.
+    # The log may grow HISTORY_TRIM_SLACK entries past the limit before it is rewritten,
+    # so appends stay cheap once the history is full.
+    MAX_HISTORY = 100
+    HISTORY_TRIM_SLACK = 20
+    
+    def __init__(self, config_file: str = "prompt_config.json", history_file: str = None):
         """
         Initialize the prompt service
         
         Args:
             config_file: Path to the prompt configuration file
+            history_file: Path to the append-only prompt history log
+                (default: the config file name with a "_history.jsonl" suffix)
         """
         self.config_file = config_file
-        self.default_prompt = """You are Synapse, a private, local-first Cognitive Partner. Your sole purpose is to help the user clarify their own thinking, acting as a sounding board and a mirror for their mind, not as an assistant, search engine, or therapist. Your prime directive is to facilitate the user's journey to their own insights by asking better questions rather than providing answers. Adhere strictly to your guiding principles: maintain intellectual honesty over agreement by respectfully challenging assumptions; prioritize Socratic questioning over giving advice; and ground all your analysis in the user's reality, using only the information they have provided. 
-
-**CRITICAL: Always format your responses using proper Markdown syntax. Never use HTML entities.**
-
-Markdown formatting requirements:
-- Use "# " for main headings and "## " for subheadings
-- Create bulleted lists with "* " at the start of each line
-- Use "**text**" for bold emphasis on key concepts  
-- Use "> " for blockquotes and important reflections
-- Use blank lines to separate paragraphs
-- Put each list item on its own line
-- Add line breaks between different sections
-- Never use HTML entities like &gt; or &lt; - always use the actual characters
-
-Before responding, follow your internal monologue: deconstruct the user's message, consult your principles, synthesize with long-term memory, formulate a non-judgmental, open-ended question, and review to ensure you are not giving a direct answer. You are strictly prohibited from giving advice, inventing external facts, or claiming to be a professional. Your voice is that of a patient, curious, and deeply analytical partner—warm and encouraging, yet always intellectually rigorous, giving the user the space to think without rushing to fill the void."""
-        self._ensure_config_file_exists()
+        self.history_file = history_file or os.path.splitext(config_file)[0] + "_history.jsonl"
+        
+        # Parsed configuration, reused until the file's mtime or size changes
+        # Held as one ((mtime_ns, size), config) tuple so readers never see a mismatched pair
+        self._config_cache = None
+        
+        # Indent the config file for debugging; it is written compactly by default
+        self.pretty_json = get_config().PRETTY_JSON
+        
+        # Serializes updates to the config and history; the flag is set when the
+        # stored history counters may no longer match the log
+        self._update_lock = threading.Lock()
+        self._history_stats_stale = False
+        
+        # The config file is created on first use rather than at construction
+        self._config_ready = False
+        self._config_ready_lock = threading.Lock()
+    
+    def _ensure_ready(self) -> None:
+        """Create or migrate the configuration files the first time they are needed"""
+        if self._config_ready:
+            return
+        with self._config_ready_lock:
+            if not self._config_ready:
+                self._ensure_config_file_exists()
+                self._config_ready = True
     
     def _ensure_config_file_exists(self) -> None:
         """Ensure the configuration file exists with default settings"""
         if not os.path.exists(self.config_file):
+            now_iso = _iso_now()
             default_config = {
                 "current_prompt": self.default_prompt,
-                "prompt_history": [
-                    {
-                        "prompt": self.default_prompt,
-                        "name": "Default Synapse Prompt",
-                        "created_at": datetime.now().isoformat(),
-                        "is_default": True
-                    }
-                ],
                 "metadata": {
-                    "created_at": datetime.now().isoformat(),
-                    "last_updated": datetime.now().isoformat(),
+                    "created_at": now_iso,
+                    "last_updated": now_iso,
+                    "prompts_created": 1,
+                    "stats": {"total": 1, "defaults": 1, "custom": 0},
                     "version": "1.0"
                 }
             }
-            self._save_config(default_config)
+            self._write_history([
+                {
+                    "prompt": self.default_prompt,
+                    "name": "Default Synapse Prompt",
+                    "created_at": now_iso,
+                    "is_default": True
+                }
+            ])
+            self._save_config(default_config, now_iso)
             logger.info(f"Created default prompt configuration file: {self.config_file}")
+        else:
+            self._migrate_embedded_history()
+    
+    def _migrate_embedded_history(self) -> None:
+        """Move a history list stored inside the config file into the history log"""
+        try:
+            config = self._load_config_for_update()
+            if "prompt_history" not in config:
+                return
+            
+            # Keep entries already in the log if a previous migration was interrupted
+            if not os.path.exists(self.history_file):
+                self._write_history(config["prompt_history"])
+            del config["prompt_history"]
+            config.setdefault("metadata", {})["stats"] = self._scan_history_stats()
+            self._save_config(config)
+            logger.info(f"Moved prompt history from {self.config_file} to {self.history_file}")
+        except PromptServiceError as e:
+            logger.warning(f"Could not migrate prompt history: {e}")
+    
+    def _write_history(self, entries: List[Dict[str, Any]]) -> None:
+        """
+        Replace the history log with the given entries
+        
+        Raises:
+            PromptServiceError: If the log cannot be written
+        """
+        try:
+            _atomic_write(self.history_file, b"".join(_json_dumps(entry) + b"\n" for entry in entries))
+        except OSError as e:
+            logger.error(f"Error writing prompt history: {e}")
+            raise PromptServiceError(f"Failed to write prompt history: {e}")
+    
+    def _append_history(self, entry: Dict[str, Any]) -> None:
+        """
+        Append a single entry to the history log
+        
+        Raises:
+            PromptServiceError: If the log cannot be written
+        """
+        line = _json_dumps(entry) + b"\n"
+        try:
+            # One write on an O_APPEND descriptor, so concurrent appends never interleave
+            fd = os.open(self.history_file, os.O_RDWR | os.O_APPEND | os.O_CREAT, 0o644)
+            try:
+                # Start on a fresh line if an earlier write was cut off mid-entry
+                size = os.fstat(fd).st_size
+                if size and os.pread(fd, 1, size - 1) != b"\n":
+                    line = b"\n" + line
+                written = os.write(fd, line)
+                while written < len(line):
+                    written += os.write(fd, line[written:])
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+        except OSError as e:
+            logger.error(f"Error appending to prompt history: {e}")
+            raise PromptServiceError(f"Failed to update prompt history: {e}")
+    
+    def _iter_history(self) -> Iterator[Dict[str, Any]]:
+        """
+        Stream entries from the history log, oldest first
+        
+        Lines that can't be parsed, such as one cut off by a crash mid-write,
+        are logged and skipped.
+        
+        Raises:
+            PromptServiceError: If the log is missing
+        """
+        try:
+            with open(self.history_file, 'rb') as f:
+                for line_number, line in enumerate(f, 1):
+                    if not line.strip():
+                        continue
+                    try:
+                        yield _json_loads(line)
+                    except json.JSONDecodeError as e:
+                        logger.warning(f"Skipping invalid line {line_number} in prompt history file: {e}")
+        except FileNotFoundError:
+            raise PromptServiceError(f"History file not found: {self.history_file}")
+    
+    def _trim_history(self) -> Optional[Dict[str, int]]:
+        """
+        Drop the oldest custom prompts so the log holds at most MAX_HISTORY entries
+        
+        Returns:
+            dict: History counters for the trimmed log, or None if nothing was dropped
+            
+        Raises:
+            PromptServiceError: If the log cannot be read or written
+        """
+        entries = list(self._iter_history())
+        if len(entries) <= self.MAX_HISTORY:
+            return None
+        
+        kept = self._recent_history(entries)
+        self._write_history(kept)
+        logger.info(f"Trimmed prompt history from {len(entries)} to {len(kept)} entries")
+        
+        defaults = sum(1 for entry in kept if entry.get("is_default", False))
+        return {"total": len(kept), "defaults": defaults, "custom": len(kept) - defaults}
+    
+    def _recent_history(self, entries: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Default prompts plus the newest custom prompts, at most MAX_HISTORY entries in all"""
+        if len(entries) <= self.MAX_HISTORY:
+            return entries
+        pinned = [entry for entry in entries if entry.get("is_default", False)]
+        custom = [entry for entry in entries if not entry.get("is_default", False)]
+        keep = max(self.MAX_HISTORY - len(pinned), 0)
+        return pinned + (custom[-keep:] if keep else [])
+    
+    def _visible_history_stats(self, history_stats: Dict[str, int]) -> Dict[str, int]:
+        """Counters for the entries _recent_history would return from a log with these counters"""
+        defaults = history_stats["defaults"]
+        custom = min(history_stats["custom"], max(self.MAX_HISTORY - defaults, 0))
+        return {"total": defaults + custom, "defaults": defaults, "custom": custom}
+    
+    def _scan_history_stats(self) -> Dict[str, int]:
+        """
+        Count history entries in a single pass over the log
+        
+        Used only when the config has no stored counters yet.
+        
+        Raises:
+            PromptServiceError: If the log cannot be read
+        """
+        total = 0
+        defaults = 0
+        for entry in self._iter_history():
+            total += 1
+            if entry.get("is_default", False):
+                defaults += 1
+        return {"total": total, "defaults": defaults, "custom": total - defaults}
     
     def _load_config(self) -> Dict[str, Any]:
         """
         Load the prompt configuration from file
         
         Returns:
-            dict: The prompt configuration data
+            dict: The prompt configuration data. This is the shared cached
+            object and must not be modified; use _load_config_for_update.
             
         Raises:
             PromptServiceError: If there's an error loading the configuration
         """
         try:
-            with open(self.config_file, 'r', encoding='utf-8') as f:
-                config = json.load(f)
+            stat = os.stat(self.config_file)
+            cached = self._config_cache
+            if cached is not None and cached[0] == (stat.st_mtime_ns, stat.st_size):
+                return cached[1]
+            
+            with open(self.config_file, 'rb') as f:
+                # Key the cache on the file actually opened, in case it was replaced since the stat
+                stat = os.fstat(f.fileno())
+                config = _json_loads(f.read())
+            
+            self._config_cache = ((stat.st_mtime_ns, stat.st_size), config)
             return config
         except FileNotFoundError:
             logger.error(f"Prompt configuration file not found: {self.config_file}")
@@ -96,22 +346,37 @@ Before responding, follow your internal monologue: deconstruct the user's messag
             logger.error(f"Error loading prompt configuration: {e}")
             raise PromptServiceError(f"Failed to load configuration: {e}")
     
-    def _save_config(self, config: Dict[str, Any]) -> None:
+    def _load_config_for_update(self) -> Dict[str, Any]:
+        """
+        Load a private copy of the prompt configuration for modification
+        
+        Returns:
+            dict: A deep copy of the configuration, to be saved with _save_config
+            
+        Raises:
+            PromptServiceError: If there's an error loading the configuration
+        """
+        return copy.deepcopy(self._load_config())
+    
+    def _save_config(self, config: Dict[str, Any], timestamp: str = None) -> None:
         """
         Save the prompt configuration to file
         
         Args:
             config: The configuration data to save
+            timestamp: ISO timestamp to record as last_updated (default: now)
             
         Raises:
             PromptServiceError: If there's an error saving the configuration
         """
         try:
             # Update metadata
-            config["metadata"]["last_updated"] = datetime.now().isoformat()
+            config["metadata"]["last_updated"] = timestamp or _iso_now()
+            
+            stat = _atomic_write(self.config_file, _json_dumps(config, pretty=self.pretty_json))
             
-            with open(self.config_file, 'w', encoding='utf-8') as f:
-                json.dump(config, f, indent=2, ensure_ascii=False)
+            # Cache what was just written so the next load doesn't re-read it
+            self._config_cache = ((stat.st_mtime_ns, stat.st_size), config)
             logger.info(f"Saved prompt configuration to {self.config_file}")
         except Exception as e:
             logger.error(f"Error saving prompt configuration: {e}")
@@ -125,6 +390,7 @@ Before responding, follow your internal monologue: deconstruct the user's messag
             str: The current system prompt
         """
         try:
+            self._ensure_ready()
             config = self._load_config()
             return config.get("current_prompt", self.default_prompt)
         except PromptServiceError:
@@ -151,35 +417,56 @@ Before responding, follow your internal monologue: deconstruct the user's messag
             raise PromptServiceError(f"Invalid prompt: {validation_result['error']}")
         
         try:
-            config = self._load_config()
-            
-            # Create prompt entry
-            prompt_entry = {
-                "prompt": new_prompt.strip(),
-                "name": name or f"Custom Prompt {len(config['prompt_history']) + 1}",
-                "created_at": datetime.now().isoformat(),
-                "is_default": False
-            }
-            
-            # Update current prompt
-            config["current_prompt"] = new_prompt.strip()
-            
-            # Add to history
-            config["prompt_history"].append(prompt_entry)
-            
-            # Save configuration
-            self._save_config(config)
-            
-            logger.info(f"Updated system prompt: {prompt_entry['name']}")
-            
-            return {
-                "success": True,
-                "message": "System prompt updated successfully",
-                "prompt_name": prompt_entry["name"],
-                "timestamp": prompt_entry["created_at"]
-            }
+            self._ensure_ready()
+            # Config and history are read-modify-written together; serialize updates
+            with self._update_lock:
+                config = self._load_config_for_update()
+                now_iso = _iso_now()
+                metadata = config.setdefault("metadata", {})
+                history_stats = metadata.get("stats")
+                if history_stats is None or self._history_stats_stale:
+                    history_stats = self._scan_history_stats()
+                history_count = history_stats["total"]
+                
+                # Number default names by prompts ever created, which keeps them unique once history is trimmed
+                prompts_created = max(metadata.get("prompts_created", 0), history_count) + 1
+                metadata["prompts_created"] = prompts_created
+                
+                # Create prompt entry
+                prompt_entry = {
+                    "prompt": new_prompt.strip(),
+                    "name": name or f"Custom Prompt {prompts_created}",
+                    "created_at": now_iso,
+                    "is_default": False
+                }
+                
+                # Update current prompt
+                config["current_prompt"] = new_prompt.strip()
+                
+                # Add to history, dropping the oldest entries once it is full
+                self._append_history(prompt_entry)
+                history_stats["total"] = history_count + 1
+                history_stats["custom"] = history_stats["custom"] + 1
+                if history_count + 1 > self.MAX_HISTORY + self.HISTORY_TRIM_SLACK:
+                    history_stats = self._trim_history() or history_stats
+                metadata["stats"] = history_stats
+                
+                # Save configuration
+                self._save_config(config, now_iso)
+                self._history_stats_stale = False
+                
+                logger.info(f"Updated system prompt: {prompt_entry['name']}")
+                
+                return {
+                    "success": True,
+                    "message": "System prompt updated successfully",
+                    "prompt_name": prompt_entry["name"],
+                    "timestamp": now_iso
+                }
             
         except Exception as e:
+            # The log may have been appended to or trimmed without the counters being saved
+            self._history_stats_stale = True
             logger.error(f"Error updating prompt: {e}")
             raise PromptServiceError(f"Failed to update prompt: {e}")
     
@@ -193,12 +480,13 @@ Before responding, follow your internal monologue: deconstruct the user's messag
         Returns:
             dict: Validation result with 'valid' boolean and optional 'error' message
         """
-        if not prompt or not prompt.strip():
+        if not prompt or prompt.isspace():
             return {
                 "valid": False,
                 "error": "Prompt cannot be empty"
             }
         
+        # strip() returns the same string when there is nothing to remove
         prompt = prompt.strip()
         
         # Check minimum length
@@ -216,20 +504,17 @@ Before responding, follow your internal monologue: deconstruct the user's messag
             }
         
         # Check for potentially problematic content
-        problematic_patterns = [
-            "ignore previous instructions",
-            "forget everything",
-            "act as if you are",
-            "pretend to be"
-        ]
-        
-        prompt_lower = prompt.lower()
-        for pattern in problematic_patterns:
-            if pattern in prompt_lower:
-                return {
-                    "valid": False,
-                    "error": f"Prompt contains potentially problematic instruction: '{pattern}'"
-                }
+        if prompt.isascii():
+            match = _PROBLEMATIC_BYTES_RE.search(prompt.encode('ascii'))
+            matched = match.group(0).decode('ascii') if match else None
+        else:
+            match = _PROBLEMATIC_RE.search(prompt)
+            matched = match.group(0) if match else None
+        if matched:
+            return {
+                "valid": False,
+                "error": f"Prompt contains potentially problematic instruction: '{matched.lower()}'"
+            }
         
         return {
             "valid": True,
@@ -260,22 +545,21 @@ Before responding, follow your internal monologue: deconstruct the user's messag
             ai_service = get_ai_service()
             original_prompt = ai_service.get_system_prompt()
             
-            # Temporarily update the system prompt
+            # Temporarily update the system prompt, restoring it even if the chat fails
             ai_service.update_system_prompt(prompt)
-            
-            # Send test message
-            test_conversation = [{"role": "user", "content": test_message}]
-            response = ai_service.chat(test_conversation)
-            
-            # Restore original prompt
-            ai_service.update_system_prompt(original_prompt)
+            try:
+                # Send test message
+                test_conversation = [{"role": "user", "content": test_message}]
+                response = ai_service.chat(test_conversation)
+            finally:
+                ai_service.update_system_prompt(original_prompt)
             
             return {
                 "success": True,
                 "test_message": test_message,
                 "response": response,
                 "response_length": len(response),
-                "timestamp": datetime.now().isoformat()
+                "timestamp": _iso_now()
             }
             
         except AIServiceError as e:
@@ -293,8 +577,8 @@ Before responding, follow your internal monologue: deconstruct the user's messag
             list: List of prompt history entries
         """
         try:
-            config = self._load_config()
-            return config.get("prompt_history", [])
+            self._ensure_ready()
+            return self._recent_history(list(self._iter_history()))
         except PromptServiceError:
             logger.warning("Using empty history due to configuration error")
             return []
@@ -313,26 +597,38 @@ Before responding, follow your internal monologue: deconstruct the user's messag
             PromptServiceError: If the index is invalid or restore fails
         """
         try:
-            config = self._load_config()
-            prompt_history = config.get("prompt_history", [])
-            
-            if prompt_index < 0 or prompt_index >= len(prompt_history):
-                raise PromptServiceError(f"Invalid prompt index: {prompt_index}")
-            
-            selected_prompt = prompt_history[prompt_index]
-            config["current_prompt"] = selected_prompt["prompt"]
-            
-            # Save configuration
-            self._save_config(config)
-            
-            logger.info(f"Restored prompt: {selected_prompt['name']}")
-            
-            return {
-                "success": True,
-                "message": f"Restored prompt: {selected_prompt['name']}",
-                "prompt_name": selected_prompt["name"],
-                "timestamp": datetime.now().isoformat()
-            }
+            self._ensure_ready()
+            # Config and history are read-modify-written together; serialize updates
+            with self._update_lock:
+                config = self._load_config_for_update()
+                
+                # Index into the same entries get_prompt_history returns
+                prompt_history = self._recent_history(list(self._iter_history()))
+                if prompt_index < 0 or prompt_index >= len(prompt_history):
+                    raise PromptServiceError(f"Invalid prompt index: {prompt_index}")
+                selected_prompt = prompt_history[prompt_index]
+                
+                config["current_prompt"] = selected_prompt["prompt"]
+                now_iso = _iso_now()
+                
+                # Repair the counters if an earlier update failed part-way
+                stats_repaired = self._history_stats_stale
+                if stats_repaired:
+                    config.setdefault("metadata", {})["stats"] = self._scan_history_stats()
+                
+                # Save configuration
+                self._save_config(config, now_iso)
+                if stats_repaired:
+                    self._history_stats_stale = False
+                
+                logger.info(f"Restored prompt: {selected_prompt['name']}")
+                
+                return {
+                    "success": True,
+                    "message": f"Restored prompt: {selected_prompt['name']}",
+                    "prompt_name": selected_prompt["name"],
+                    "timestamp": now_iso
+                }
             
         except Exception as e:
             logger.error(f"Error restoring prompt: {e}")
@@ -346,15 +642,25 @@ Before responding, follow your internal monologue: deconstruct the user's messag
             dict: Statistics about prompts
         """
         try:
+            self._ensure_ready()
             config = self._load_config()
-            prompt_history = config.get("prompt_history", [])
             current_prompt = config.get("current_prompt", "")
             
+            # Counters are kept in the metadata; older configs fall back to scanning the log
+            history_stats = config.get("metadata", {}).get("stats")
+            if history_stats is None or self._history_stats_stale:
+                try:
+                    history_stats = self._scan_history_stats()
+                except PromptServiceError:
+                    logger.warning("Using empty history due to configuration error")
+                    history_stats = {"total": 0, "defaults": 0, "custom": 0}
+            history_stats = self._visible_history_stats(history_stats)
+            
             return {
-                "total_prompts": len(prompt_history),
+                "total_prompts": history_stats["total"],
                 "current_prompt_length": len(current_prompt),
-                "default_prompts": len([p for p in prompt_history if p.get("is_default", False)]),
-                "custom_prompts": len([p for p in prompt_history if not p.get("is_default", False)]),
+                "default_prompts": history_stats["defaults"],
+                "custom_prompts": history_stats["custom"],
                 "last_updated": config.get("metadata", {}).get("last_updated"),
                 "config_version": config.get("metadata", {}).get("version")
             }
@@ -371,6 +677,7 @@ Before responding, follow your internal monologue: deconstruct the user's messag
 
 # Global prompt service instance
 _prompt_service_instance = None
+_prompt_service_lock = threading.Lock()
 
 def get_prompt_service(config_file: str = "prompt_config.json") -> PromptService:
     """
@@ -384,12 +691,16 @@ def get_prompt_service(config_file: str = "prompt_config.json") -> PromptService
     """
     global _prompt_service_instance
     
+    # Double-checked so the common path doesn't take the lock
     if _prompt_service_instance is None:
-        _prompt_service_instance = PromptService(config_file=config_file)
+        with _prompt_service_lock:
+            if _prompt_service_instance is None:
+                _prompt_service_instance = PromptService(config_file=config_file)
     
     return _prompt_service_instance
 
 def reset_prompt_service():
     """Reset the global prompt service instance (useful for testing)"""
     global _prompt_service_instance
-    _prompt_service_instance = None
\ No newline at end of file
+    with _prompt_service_lock:
+        _prompt_service_instance = None
\ No newline at end of file